@@ -1,11 +1,18 @@
 import streamlit as st
+import sqlite3
 import json
+import os
 import time
-from PIL import Image
+import html
+import glob
+import hashlib
+import tempfile
+from collections import defaultdict
+from functools import lru_cache
 # Rebuilding app
 # --- CUSTOM DATABASE UTILS ---
 # This file handles all the talking to your new SQLite database
-from db_utils import get_all_recipes, save_new_recipe, convert_ml_to_oz
+from db_utils import get_all_recipes, save_new_recipe, save_new_recipes_bulk, convert_many
 # NEW: Import admin functions
 from db_utils import delete_recipe, update_recipe_category, update_recipe_details, update_whole_recipe
 
@@ -38,21 +45,116 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Menu categories (order matters for the dialogs; unknown categories default to Classics)
+CATEGORIES = ('Featured Sips', 'Craft Cocktails', 'Classics', 'Beer', 'Wine', 'Liquors', 'Zero Proof')
+CAT_INDEX = {c: i for i, c in enumerate(CATEGORIES)}
+CARD_CATEGORIES = ('Featured Sips', 'Craft Cocktails', 'Classics', 'Zero Proof')
+LIST_CATEGORIES = ('Beer', 'Wine', 'Liquors')
+
 # --- 2. SESSION STATE SETUP ---
 if 'bartender_mode' not in st.session_state:
     st.session_state.bartender_mode = False
 if 'show_import_menu' not in st.session_state:
     st.session_state.show_import_menu = False
+if 'menu_version' not in st.session_state:
+    st.session_state.menu_version = 0
+
+# --- CACHED DB READS ---
+# Reads are served from memory and only hit SQLite again after a write bumps menu_version
+@st.cache_data(ttl=None)
+def _load_recipes(version):
+    return get_all_recipes()
+
+# Master catalog is only re-parsed when menu.json changes on disk
+# Unit conversion runs here too, so the import form never converts on a rerun
+@st.cache_data
+def _load_master(mtime):
+    with open("menu.json", "r") as f:
+        master_list = json.load(f)
+    # Convert every spec in the catalog in one batch, then slice back out per recipe
+    flat = convert_many([s for r in master_list for s in r.get('specs', [])])
+    converted, pos = [], 0
+    for r in master_list:
+        if 'specs' in r:
+            converted.append(flat[pos:pos + len(r['specs'])])
+            pos += len(r['specs'])
+        else:
+            converted.append(None)
+    return master_list, converted
+
+# (recipe, lowercased search text) pairs, built once per menu version instead of once per keystroke.
+# Each text is built from the very recipe it's paired with, so the two can never get out of step.
+# Search criteria: Name, Spirit, or any Spec line (NUL-joined so a query can't match across fields)
+# menu_version is per session, so several versions can be live at once; all are dropped on any write
+@st.cache_data(ttl=None, max_entries=16)
+def _search_index(version):
+    return [
+        (r, "\0".join([r['name'].lower(), str(r.get('spirit', '')).lower(), *(s.lower() for s in r.get('specs', []))]))
+        for r in _load_recipes(version)
+    ]
+
+# Everything between the DB and the widgets (search filter, category grouping,
+# wine/liquor sub-buckets) is derived once per (menu_version, search) pair
+# Bounded: every distinct search string is a new entry, so keep only the most recent ones
+@st.cache_data(ttl=None, max_entries=32)
+def _menu_view(version, search_query):
+    if search_query:
+        recipes = [r for r, text in _search_index(version) if search_query in text]
+    else:
+        recipes = _load_recipes(version)
+
+    # Single pass; anything uncategorized falls back to Classics
+    allowed_cats = frozenset(CARD_CATEGORIES + LIST_CATEGORIES)
+    grouped = defaultdict(list)
+    for recipe in recipes:
+        cat = recipe.get('category')
+        grouped[cat if cat in allowed_cats else 'Classics'].append(recipe)
+
+    # Wine sub-groups (None bucket = Other Wines)
+    wines_by_type = {sub: [] for sub in WINE_SUBGROUPS}
+    other_wines = []
+    for r in grouped.get('Wine', []):
+        bucket = _wine_bucket(r.get('spirit') or '')
+        if bucket:
+            wines_by_type[bucket].append(r)
+        else:
+            other_wines.append(r)
+
+    # Liquor sub-groups: house pours are the wells
+    wells, other_liquors = [], []
+    for r in grouped.get('Liquors', []):
+        if 'house' in (r.get('spirit') or '').lower():
+            wells.append(r)
+        else:
+            other_liquors.append(r)
+
+    return {
+        'count': len(recipes),
+        'grouped': dict(grouped),
+        'wines_by_type': wines_by_type,
+        'other_wines': other_wines,
+        'liquor_wells': wells,
+        'liquor_others': other_liquors,
+    }
+
+def refresh_menu():
+    """Invalidates the cached menu after a DB write."""
+    st.session_state.menu_version += 1
+    # Drop entries other sessions may still key on
+    _load_recipes.clear()
+    _search_index.clear()
+    _menu_view.clear()
 
 # --- 3. HELPER: DIALOGS ---
+def _split_lines(block):
+    """Text area -> list of non-empty, stripped lines (each line is stripped once)."""
+    return [line for line in map(str.strip, block.splitlines()) if line]
+
 @st.dialog("Edit Recipe")
 def edit_recipe_dialog(recipe):
     # Form Inputs
     new_name = st.text_input("Name", value=recipe['name'])
-    new_cat = st.selectbox("Category", 
-        ['Featured Sips', 'Craft Cocktails', 'Classics', 'Beer', 'Wine', 'Liquors', 'Zero Proof'],
-        index=['Featured Sips', 'Craft Cocktails', 'Classics', 'Beer', 'Wine', 'Liquors', 'Zero Proof'].index(recipe['category']) if recipe['category'] in ['Featured Sips', 'Craft Cocktails', 'Classics', 'Beer', 'Wine', 'Liquors', 'Zero Proof'] else 2
-    )
+    new_cat = st.selectbox("Category", CATEGORIES, index=CAT_INDEX.get(recipe['category'], 2))
     new_desc = st.text_area("Description", value=recipe.get('description') or "")
     new_spirit = st.text_input("Spirit (Sub-grouping)", value=recipe.get('spirit') or "", help="Used for filtering wines (Red Wine, White Wine, etc.)")
     new_price = st.text_input("Price", value=recipe.get('price') or "")
@@ -66,7 +168,7 @@ def edit_recipe_dialog(recipe):
     
     if st.button("Save Changes"):
         # Process Specs back to list
-        new_specs_list = [line.strip() for line in new_specs_block.split('\n') if line.strip()]
+        new_specs_list = _split_lines(new_specs_block)
         
         data = {
             'name': new_name,
@@ -79,7 +181,11 @@ def edit_recipe_dialog(recipe):
             'spirit': new_spirit
         }
         
-        if update_whole_recipe(recipe['id'], data):
+        # No-op save: skip the DB write and keep every cached view warm (NULL columns read as "")
+        if all((recipe.get(k) or ([] if k == 'specs' else "")) == v for k, v in data.items()):
+            st.info("No changes to save.")
+        elif update_whole_recipe(recipe['id'], data):
+            refresh_menu()
             st.success("Recipe Updated!")
             time.sleep(0.5)
             st.rerun()
@@ -90,7 +196,7 @@ def edit_recipe_dialog(recipe):
 def add_recipe_dialog():
     st.info("Create a new menu item.")
     name = st.text_input("Name")
-    cat = st.selectbox("Category", ['Featured Sips', 'Craft Cocktails', 'Classics', 'Beer', 'Wine', 'Liquors', 'Zero Proof'])
+    cat = st.selectbox("Category", CATEGORIES)
     desc = st.text_area("Description")
     spirit = st.text_input("Spirit / Sub-type", help="e.g. Red Wine, White Wine for filtering")
     price = st.text_input("Price (e.g. $12)")
@@ -103,7 +209,7 @@ def add_recipe_dialog():
             st.error("Name is required.")
             return
 
-        specs_list = [line.strip() for line in specs_block.split('\n') if line.strip()]
+        specs_list = _split_lines(specs_block)
         data = {
             'name': name,
             'category': cat,
@@ -115,6 +221,7 @@ def add_recipe_dialog():
             'spirit': spirit
         }
         if save_new_recipe(data):
+            refresh_menu()
             st.success("Added new drink!")
             time.sleep(0.5)
             st.rerun()
@@ -122,6 +229,128 @@ def add_recipe_dialog():
             st.error("Failed to save (Name might use duplicate?).")
 
 
+# --- HELPER: CARD IMAGES ---
+CARD_IMAGE_MAX = 800 # px; cards display at 200px tall, this leaves room for hi-dpi screens
+THUMB_DIR = os.path.join("images", "thumbs")
+WEB_SAFE_FORMATS = frozenset({'JPEG', 'PNG', 'WEBP', 'GIF'}) # Browsers show these as-is
+
+@st.cache_data(show_spinner=False)
+def _card_thumbnail(path, mtime_ns, size):
+    """Path to a downscaled, upright WebP of a local card image (or the original if it's already fine).
+    Written to THUMB_DIR once per source file version, so even a restart doesn't re-decode."""
+    # Named by full source path (no clashes between same-named files) + exact file version
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    thumb_path = os.path.join(THUMB_DIR, f"{key}_{mtime_ns}_{size}.webp")
+    if os.path.exists(thumb_path):
+        return thumb_path
+
+    from PIL import Image, ImageOps # Only loaded once a card actually has a local photo
+    with Image.open(path) as img:
+        # Already small & upright -> serve the original (open() only read the header, no decode)
+        if (img.format in WEB_SAFE_FORMATS and max(img.size) <= CARD_IMAGE_MAX
+                and img.getexif().get(0x0112, 1) == 1):
+            return path
+        has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+        img.draft('RGB', (CARD_IMAGE_MAX, CARD_IMAGE_MAX)) # libjpeg decodes at reduced scale
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((CARD_IMAGE_MAX, CARD_IMAGE_MAX))
+        img = img.convert('RGBA' if has_alpha else 'RGB') # WebP keeps transparency
+    tmp_path = None
+    try:
+        # Write to a temp file, then rename: a half-written thumbnail never sits under the real name
+        os.makedirs(THUMB_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=THUMB_DIR, suffix='.tmp', delete=False) as tmp:
+            tmp_path = tmp.name
+            img.save(tmp, 'WEBP', quality=80)
+        os.replace(tmp_path, thumb_path)
+    except OSError:
+        # Read-only deploy, permissions, full disk... -> just show the original
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass # Never got created / already gone
+        return path
+
+    # Drop thumbnails of older versions of this same source
+    for old in glob.glob(os.path.join(THUMB_DIR, f"{key}_*.webp")):
+        if old != thumb_path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass # Already gone
+    return thumb_path
+
+# Local photos are stat'ed at most once per IMAGE_STAT_TTL per path (not per card per rerun);
+# new, replaced or deleted files show up within that window
+IMAGE_STAT_TTL = 10 # seconds
+
+@st.cache_data(ttl=IMAGE_STAT_TTL, max_entries=1024, show_spinner=False)
+def _image_version(path):
+    """(mtime_ns, size) of a local image, or None if it's missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _card_image_src(url):
+    """What st.image should show for a card's image_url (None = no image)."""
+    if url.startswith(('http://', 'https://')):
+        return url # Remote URL, trusted as-is
+    version = _image_version(url)
+    if version is None:
+        return None # Missing file -> no image
+    return _card_thumbnail(url, *version)
+
+# --- HELPER: GUEST CARD TEXT ---
+@lru_cache(maxsize=1024)
+def _card_html(name, desc, price):
+    """Name / caption-style description / price for a guest card as ONE escaped HTML block."""
+    parts = [f"<h3>{html.escape(name)}</h3>"]
+    if desc: parts.append(f'<p style="color: gray; font-size: 0.875rem;"><i>{html.escape(desc)}</i></p>')
+    if price: parts.append(f"<p><b>{html.escape(price)}</b></p>")
+    return "".join(parts)
+
+# --- HELPER: LIST VIEW ROWS ---
+@lru_cache(maxsize=2048)
+def _row_html(name, desc, price):
+    """Tight one-line HTML row for the Beer/Wine/Liquor lists (escaped, since it's rendered unsafe)."""
+    desc_span = f"<i>{html.escape(desc)}</i>" if desc else ""
+    price_span = f"<b>{html.escape(price)}</b>" if price else ""
+    return f'<div style="line-height:1.4; margin-bottom: 4px;"><b>{html.escape(name)}</b> | {desc_span} | {price_span}</div>'
+
+def _rows_html(recipes):
+    """Whole section as one HTML blob -> one Streamlit element instead of one per row."""
+    return "\n".join(_row_html(r['name'], r.get('description'), r.get('price')) for r in recipes)
+
+WINE_SUBGROUPS = ('House Wine', 'Red Wine', 'White Wine', 'Bubbles')
+
+@lru_cache(maxsize=256)
+def _wine_bucket(spirit):
+    """Maps a wine's spirit field to its sub-group (None = Other Wines). Few distinct values, so memoized."""
+    if spirit in WINE_SUBGROUPS: return spirit
+    if 'Red' in spirit: return 'Red Wine'
+    if 'White' in spirit: return 'White Wine'
+    if 'Sparkling' in spirit or 'Bubbles' in spirit or 'Champagne' in spirit: return 'Bubbles'
+    return None
+
+def render_admin_controls(cat, recipes):
+    """Single Edit/Del picker for a whole list-view category."""
+    names = {r['id']: r['name'] for r in recipes}
+    st.markdown("---")
+    c1, c2, c3 = st.columns([0.7, 0.15, 0.15])
+    with c1:
+        rid = st.selectbox("Manage", options=list(names), format_func=names.get,
+                           key=f"adm_{cat}", label_visibility="collapsed")
+    with c2:
+        if st.button("Edit", key=f"adm_ed_{cat}"):
+            edit_recipe_dialog(next(r for r in recipes if r['id'] == rid))
+    with c3:
+        if st.button("Del", key=f"adm_dl_{cat}"):
+            delete_recipe(rid); refresh_menu(); st.rerun()
+
+
 # --- 4. SIDEBAR (SETTINGS) ---
 def toggle_bartender_mode():
     pass 
@@ -134,8 +363,10 @@ with st.sidebar:
         value=st.session_state.bartender_mode,
         key="bartender_toggle" 
     )
+    # Read once; every render branch below keys off this flag
+    bartender_mode = st.session_state.bartender_mode
     
-    if st.session_state.bartender_mode:
+    if bartender_mode:
         st.info("🔧 Top Shelf Mode Active")
         st.markdown("---")
         st.subheader("Admin Tools")
@@ -145,48 +376,32 @@ with st.sidebar:
 # --- 5. MAIN APP LOGIC (Your Menu) ---
 st.title("🍸 The Home Bar")
 
-# A. Load Active Recipes from Database
-active_recipes = get_all_recipes()
-
-# B. Global Search Bar
+# A. Global Search Bar
 search_query = st.text_input("🔍 Search Cocktails...", placeholder="Name, Spirit, or Ingredient").lower().strip()
 
-if search_query:
-    filtered_recipes = []
-    for r in active_recipes:
-        # Search criteria: Name, Spirit, or any Spec line
-        in_name = search_query in r['name'].lower()
-        in_spirit = search_query in str(r.get('spirit', '')).lower()
-        in_specs = any(search_query in s.lower() for s in r.get('specs', []))
-        
-        if in_name or in_spirit or in_specs:
-            filtered_recipes.append(r)
-    active_recipes = filtered_recipes
+# B. Load + group Active Recipes (cached; only recomputed after a DB write or a new search)
+try:
+    menu_view = _menu_view(st.session_state.menu_version, search_query)
+except sqlite3.Error as e:
+    # Failed loads aren't cached, so the next rerun simply tries the DB again
+    st.error(f"Couldn't load the menu right now ({e}). Try again in a moment.")
+    st.stop()
+grouped_recipes = menu_view['grouped']
 
 # C. Display Your Bar (The Menu)
-if not active_recipes:
+if not menu_view['count']:
     if search_query:
         st.warning("No cocktails found matching your search.")
     else:
         st.info("Your bar is empty! Switch to Bartender Mode to import recipes.")
 else:
-    # Categories
-    card_categories = ['Featured Sips', 'Craft Cocktails', 'Classics', 'Zero Proof']
-    list_categories = ['Beer', 'Wine', 'Liquors']
-    
-    grouped_recipes = {cat: [] for cat in card_categories + list_categories}
-    
-    for recipe in active_recipes:
-        cat = recipe.get('category')
-        all_cats = card_categories + list_categories
-        if not cat or cat not in all_cats:
-            cat = 'Classics'
-        grouped_recipes[cat].append(recipe)
+    # Only categories that actually have items get rendered
+    card_non_empty = [c for c in CARD_CATEGORIES if grouped_recipes.get(c)]
+    list_non_empty = [c for c in LIST_CATEGORIES if grouped_recipes.get(c)]
 
     # --- PART 1: COCKTAIL CARDS (Collapsible) ---
-    for cat in card_categories:
+    for cat in card_non_empty:
         recipes = grouped_recipes[cat]
-        if not recipes: continue
             
         # Auto-Expand if Searching, otherwise only Featured Sips
         is_expanded = bool(search_query) or (cat == 'Featured Sips')
@@ -194,26 +409,26 @@ else:
         with st.expander(f"**{cat}**", expanded=is_expanded):
             
             # BARTENDER MODE: Condensed List View
-            if st.session_state.bartender_mode:
+            if bartender_mode:
                 for r in recipes:
                     with st.container(border=True):
                         c1, c2 = st.columns([0.85, 0.15])
                         with c1:
                             st.markdown(f"### {r['name']}")
-                            # Specs
+                            # Specs & Instructions in one element (one delta instead of one per line)
+                            body = []
                             if r.get('specs'):
-                                st.markdown("**Specs:**")
-                                for s in r['specs']:
-                                    st.markdown(f"- {s}")
-                            # Instructions
+                                body.append("**Specs:**\n" + "\n".join(f"- {s}" for s in r['specs']))
                             if r.get('instructions'):
-                                st.markdown(f"**Method:** {r['instructions']}")
+                                body.append(f"**Method:** {r['instructions']}")
+                            if body: st.markdown("\n\n".join(body))
                         
                         with c2:
                             st.write("") # Spacer
                             if st.button("Edit", key=f"ed_{r['id']}"): edit_recipe_dialog(r)
                             if st.button("Del", key=f"del_{r['id']}"): 
                                 delete_recipe(r['id'])
+                                refresh_menu()
                                 st.rerun()
 
             # GUEST MODE: Sales Card View
@@ -222,30 +437,23 @@ else:
                 for i, recipe in enumerate(recipes):
                     with cols[i % 3]:
                         with st.container(border=True):
-                            # Image Logic (Try/Except + st.image)
+                            # Image Logic (local files go through the thumbnail cache)
                             if recipe.get('image_url'):
                                 try:
-                                    st.image(recipe['image_url'], use_container_width=True)
-                                except:
-                                    pass # Hide if broken
+                                    src = _card_image_src(recipe['image_url'])
+                                    if src: st.image(src, use_container_width=True)
+                                except (OSError, ValueError):
+                                    pass # Unreadable/corrupt file -> hide it (everything else should surface)
 
-                            # Name & Desc
-                            st.markdown(f"### {recipe['name']}")
-                            
-                            if recipe.get('description'):
-                                st.caption(f"*{recipe['description']}*")
-                            
-                            if recipe.get('price'):
-                                 st.write(f"**{recipe['price']}**")
+                            # Name, Desc & Price in one element
+                            st.markdown(_card_html(recipe['name'], recipe.get('description'), recipe.get('price')), unsafe_allow_html=True)
                             
                             # HIDDEN FOR GUESTS: Ingredients & Instructions
 
     # --- PART 2: LIST VIEW (Beer/Wine - Tight) ---
-    # --- PART 2: LIST VIEW (Beer/Wine - Tight) ---
     
-    for cat in list_categories:
+    for cat in list_non_empty:
         recipes = grouped_recipes[cat]
-        if not recipes: continue
         
         # Wrap category in Expander
         # Auto-Expand if Searching, otherwise default False (Closed)
@@ -254,142 +462,53 @@ else:
         
             # WINE SUB-GROUPING
             if cat == 'Wine':
-                # Predefined Sub-Groups
-                wine_subgroups = ['House Wine', 'Red Wine', 'White Wine', 'Bubbles']
-                # We sort recipes into these buckets
-                wines_by_type = {sub: [] for sub in wine_subgroups}
-                others = []
-                
-                for r in recipes:
-                    # Filter by Spirit field (populated by migration or manually)
-                    # Fallback to checking name if spirit is empty?
-                    s = r.get('spirit', '')
-                    if s in wine_subgroups:
-                        wines_by_type[s].append(r)
-                    elif 'Red' in s: wines_by_type['Red Wine'].append(r)
-                    elif 'White' in s: wines_by_type['White Wine'].append(r)
-                    elif 'Sparkling' in s or 'Bubbles' in s or 'Champagne' in s: wines_by_type['Bubbles'].append(r)
-                    else:
-                        others.append(r) # Fallback
+                wines_by_type = menu_view['wines_by_type']
+                others = menu_view['other_wines']
                 
                 # Display Subgroups
-                for sub in wine_subgroups:
+                for sub in WINE_SUBGROUPS:
                     if wines_by_type[sub]:
                         st.subheader(sub)
-                        for r in wines_by_type[sub]:
-                            # Tight MD Block
-                            price_span = f"<b>{r['price']}</b>" if r.get('price') else ""
-                            desc_span = f"<i>{r['description']}</i>" if r.get('description') else ""
-                            row_html = f"""
-                            <div style="line-height:1.4; margin-bottom: 4px;">
-                                <b>{r['name']}</b> &nbsp;|&nbsp; {desc_span} &nbsp;|&nbsp; {price_span}
-                            </div>
-                            """
-                            col_txt, col_btn = st.columns([0.9, 0.1])
-                            with col_txt:
-                                st.markdown(row_html, unsafe_allow_html=True)
-                            with col_btn:
-                                if st.session_state.bartender_mode:
-                                    with st.popover("⋮"):
-                                        if st.button("Edit", key=f"ed_w_{r['id']}"): edit_recipe_dialog(r)
-                                        if st.button("Del", key=f"dl_w_{r['id']}"): 
-                                            delete_recipe(r['id'])
-                                            st.rerun()
+                        st.markdown(_rows_html(wines_by_type[sub]), unsafe_allow_html=True)
                 
                 # Display Others
                 if others:
                     st.subheader("Other Wines")
-                    for r in others:
-                         # Same HTML block logic... (Refactor potential but inline is fine for now)
-                        price_span = f"<b>{r['price']}</b>" if r.get('price') else ""
-                        desc_span = f"<i>{r['description']}</i>" if r.get('description') else ""
-                        row_html = f"""<div style="line-height:1.4; margin-bottom: 4px;"><b>{r['name']}</b> | {desc_span} | {price_span}</div>"""
-                        col_txt, col_btn = st.columns([0.9, 0.1])
-                        with col_txt: st.markdown(row_html, unsafe_allow_html=True)
-                        with col_btn:
-                            if st.session_state.bartender_mode:
-                                with st.popover("⋮"):
-                                    if st.button("Edit", key=f"ed_wo_{r['id']}"): edit_recipe_dialog(r)
-                                    if st.button("Del", key=f"dl_wo_{r['id']}"): 
-                                        delete_recipe(r['id']); st.rerun()
+                    st.markdown(_rows_html(others), unsafe_allow_html=True)
 
             # LIQUORS (Grouped)
             elif cat == 'Liquors':
                 # Sub-Groups
-                wells = []
-                others = []
-                
-                for r in recipes:
-                    s = r.get('spirit', '').lower()
-                    if 'house' in s:
-                        wells.append(r)
-                    else:
-                        others.append(r)
+                wells = menu_view['liquor_wells']
+                others = menu_view['liquor_others']
                 
                 # 1. Premium Wells
                 if wells:
                     st.subheader("Premium Wells")
-                    for r in wells:
-                        price_span = f"<b>{r['price']}</b>" if r.get('price') else ""
-                        desc_span = f"<i>{r['description']}</i>" if r.get('description') else ""
-                        row_html = f"""<div style="line-height:1.4; margin-bottom: 4px;"><b>{r['name']}</b> | {desc_span} | {price_span}</div>"""
-                        
-                        col_txt, col_btn = st.columns([0.9, 0.1])
-                        with col_txt: st.markdown(row_html, unsafe_allow_html=True)
-                        with col_btn:
-                            if st.session_state.bartender_mode:
-                                with st.popover("⋮"):
-                                    if st.button("Edit", key=f"ed_l_{r['id']}"): edit_recipe_dialog(r)
-                                    if st.button("Del", key=f"dl_l_{r['id']}"): 
-                                        delete_recipe(r['id']); st.rerun()
+                    st.markdown(_rows_html(wells), unsafe_allow_html=True)
 
                 # 2. Premium Selections (Others)
                 if others:
                     st.subheader("Premium Selections")
-                    for r in others:
-                        price_span = f"<b>{r['price']}</b>" if r.get('price') else ""
-                        desc_span = f"<i>{r['description']}</i>" if r.get('description') else ""
-                        row_html = f"""<div style="line-height:1.4; margin-bottom: 4px;"><b>{r['name']}</b> | {desc_span} | {price_span}</div>"""
-                        
-                        col_txt, col_btn = st.columns([0.9, 0.1])
-                        with col_txt: st.markdown(row_html, unsafe_allow_html=True)
-                        with col_btn:
-                            if st.session_state.bartender_mode:
-                                with st.popover("⋮"):
-                                    if st.button("Edit", key=f"ed_lo_{r['id']}"): edit_recipe_dialog(r)
-                                    if st.button("Del", key=f"dl_lo_{r['id']}"): 
-                                        delete_recipe(r['id']); st.rerun()
+                    st.markdown(_rows_html(others), unsafe_allow_html=True)
 
             # BEER (Simple List)
             else:
                 if cat == 'Beer': st.caption("*Bottle | Draft*")
                 
-                for r in recipes:
-                    price_span = f"<b>{r['price']}</b>" if r.get('price') else ""
-                    desc_span = f"<i>{r['description']}</i>" if r.get('description') else ""
-                    
-                    # HTML Block for tight spacing
-                    row_html = f"""
-                    <div style="line-height:1.4; margin-bottom: 4px;">
-                        <b>{r['name']}</b> &nbsp;|&nbsp; {desc_span} &nbsp;|&nbsp; {price_span}
-                    </div>
-                    """
-                    
-                    c1, c2 = st.columns([0.9, 0.1])
-                    with c1:
-                        st.markdown(row_html, unsafe_allow_html=True)
-                    with c2:
-                        if st.session_state.bartender_mode:
-                             with st.popover("⋮"):
-                                  if st.button("Edit", key=f"ed_b_{r['id']}"): edit_recipe_dialog(r)
-                                  if st.button("Del", key=f"dl_b_{r['id']}"): 
-                                        delete_recipe(r['id']); st.rerun()
+                st.markdown(_rows_html(recipes), unsafe_allow_html=True)
+
+            # Admin controls: ONE picker per category instead of a popover per row
+            if bartender_mode:
+                render_admin_controls(cat, recipes)
 
 
 
 # --- 6. BARTENDER TOOLS (The Import Section) ---
 # This section is ONLY for adding NEW things to your database.
-if st.session_state.bartender_mode:
+@st.fragment
+def render_import_tools():
+    """Catalog import UI. As a fragment, toggling/ticking only reruns this block, not the whole menu."""
     st.header("🛠️ Bartender Tools: Classics Import")
     
     # 1. The Trigger Button
@@ -402,41 +521,40 @@ if st.session_state.bartender_mode:
             st.info("Select recipes from the master list. Units will convert to ounces automatically.")
             
             try:
-                with open("menu.json", "r") as f:
-                    master_list = json.load(f)
+                master_list, converted_specs = _load_master(os.path.getmtime("menu.json"))
             except FileNotFoundError:
                 st.error("Could not find 'menu.json'. Make sure the file exists.")
-                master_list = []
+                master_list, converted_specs = [], []
 
             with st.form(key='import_form'):
-                selected_recipes = []
-                
-                for i, recipe in enumerate(master_list):
-                    col1, col2 = st.columns([0.1, 0.9])
-                    
-                    with col1:
-                        checked = st.checkbox("", key=f"import_check_{i}")
-                    
-                    with col2:
-                        st.markdown(f"**{recipe.get('name')}**")
-                        if 'specs' in recipe:
-                            preview = [convert_ml_to_oz(s) for s in recipe['specs']]
-                            st.caption(f"{', '.join(preview[:2])}...")
-
-                    if checked:
-                        selected_recipes.append(recipe)
+                # One editable table instead of a checkbox + columns pair per recipe
+                rows = [{
+                    "Select": False,
+                    "Name": recipe.get('name'),
+                    "Preview": f"{', '.join(converted_specs[i][:2])}..." if converted_specs[i] is not None else ""
+                } for i, recipe in enumerate(master_list)]
+                edited = st.data_editor(
+                    rows,
+                    column_config={"Select": st.column_config.CheckboxColumn("Select", width="small")},
+                    disabled=["Name", "Preview"],
+                    hide_index=True,
+                    key="import_editor"
+                )
 
                 st.markdown("---")
                 
                 if st.form_submit_button("Import Selected Recipes"):
+                    # Selection state lives in the editor widget; only read it on submit
+                    selected_recipes = [i for i, row in enumerate(edited) if row["Select"]]
                     if not selected_recipes:
                         st.warning("No recipes selected.")
                     else:
-                        success_count = 0
-                        for item in selected_recipes:
+                        to_import = []
+                        for i in selected_recipes:
+                            item = master_list[i]
                             to_save = item.copy()
-                            if 'specs' in to_save:
-                                to_save['specs'] = [convert_ml_to_oz(s) for s in to_save['specs']]
+                            if converted_specs[i] is not None:
+                                to_save['specs'] = converted_specs[i] # Already converted at load
                             
                             # Default new imports to Classics if no category logic applied here yet
                             # (Actually db migration logic isn't here, so we should allow db_utils to handle defaults 
@@ -444,10 +562,15 @@ if st.session_state.bartender_mode:
                             to_save['category'] = to_save.get('category', 'Classics')
                             if 'is_cotw' in item and item['is_cotw']: to_save['category'] = 'Featured Sips'
 
-                            if save_new_recipe(to_save):
-                                success_count += 1
+                            to_import.append(to_save)
                         
+                        # One transaction for the whole batch instead of one per recipe
+                        success_count = save_new_recipes_bulk(to_import)
+                        if success_count: refresh_menu()
                         st.success(f"Successfully imported {success_count} cocktails!")
                         time.sleep(1)
                         st.session_state.show_import_menu = False
-                        st.rerun()
\ No newline at end of file
+                        st.rerun(scope="app") # Full rerun so the new recipes show up in the menu
+
+if bartender_mode:
+    render_import_tools()
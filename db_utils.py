@@ -1,38 +1,91 @@
 import sqlite3
 import re
 import os
+import threading
+from functools import lru_cache, wraps
+import streamlit as st
 
 DB_NAME = "bar.db"
 
+# --- 0. SHARED CONNECTION ---
+@st.cache_resource
+def get_db_connection():
+    """One long-lived connection per process, reused across Streamlit reruns and sessions."""
+    conn = sqlite3.connect(DB_NAME, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY") # Sorts/temp indexes never touch disk
+    conn.execute("PRAGMA cache_size=-64000") # ~64MB page cache (negative = KiB); only grows as pages are read
+    # Existing DBs pick up the recipe_id index too (init_db only runs from the setup script)
+    try:
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_recipe_id ON recipe_ingredients(recipe_id)")
+        conn.commit()
+    except sqlite3.OperationalError:
+        pass # Tables not created yet -> init_db adds the index
+    return conn
+
+# Sessions run on different threads but share that one connection (and so its open transaction).
+# Every DB helper holds this lock from its first statement to its commit/rollback,
+# so one session's commit/rollback never covers another session's half-done writes.
+_db_lock = threading.RLock()
+
+def _locked(func):
+    """Runs a DB helper while holding _db_lock."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _db_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
 # --- 1. YOUR HELPER FUNCTION ---
-def convert_ml_to_oz(text):
-    """Converts metric units to US oz (rounded to 0.25oz)."""
-    # Regex to find numbers followed by ml or cl
-    pattern = r'(\d+\.?\d*)\s*(ml|cl)'
+# Regexes are compiled once at import instead of on every call
+_ML_CL_RE = re.compile(r'(\d+\.?\d*)\s*(ml|cl)', re.IGNORECASE)  # numbers followed by ml or cl
+# Amount is a single well-formed number ('2', '1.5', '.75', '1.'), so junk like '1.2.3' just doesn't match
+_SPEC_RE = re.compile(r"(\d+(?:\.\d*)?|\.\d+)\s*(oz|dashes|dash|cl|ml)?\s+(.*)", re.IGNORECASE)  # '1.5 oz Bourbon'
+
+def _ml_to_oz_str(value):
+    """Millilitres -> display string, rounded to the nearest quarter ounce."""
+    ounces = round(value / 30, 2) # Rough conversion: 30ml = 1oz
     
-    def convert_match(match):
-        value = float(match.group(1))
-        unit = match.group(2)
-        if unit == 'cl': value *= 10  # Convert cl to ml first
-        ounces = round(value / 30, 2) # Rough conversion: 30ml = 1oz
-        
-        # Round to nearest quarter ounce for readability
-        if ounces < 0.15: return "dash" 
-        
-        remainder = ounces % 0.25
-        if remainder < 0.12:
-            ounces = ounces - remainder
-        else:
-            ounces = ounces + (0.25 - remainder)
-            
-        return f"{ounces:.2f} oz".replace(".00", "") 
+    # Round to nearest quarter ounce for readability
+    if ounces < 0.15: return "dash" 
+    
+    remainder = ounces % 0.25
+    if remainder < 0.12:
+        ounces = ounces - remainder
+    else:
+        ounces = ounces + (0.25 - remainder)
         
-    return re.sub(pattern, convert_match, text, flags=re.IGNORECASE)
+    return f"{ounces:.2f} oz".replace(".00", "") 
+
+@lru_cache(maxsize=512)
+def _convert_amount(value_str, unit):
+    """'<n>', 'ml'|'cl' -> oz string. Specs reuse a handful of pours, so repeats are a cache hit."""
+    value = float(value_str)
+    if unit == 'cl': value *= 10  # Convert cl to ml first
+    return _ml_to_oz_str(value)
+
+def _convert_match(match):
+    """re.sub callback: one '<n> ml|cl' match -> rounded US oz string."""
+    return _convert_amount(match.group(1), match.group(2))
+
+def convert_ml_to_oz(text):
+    """Converts metric units to US oz (rounded to 0.25oz)."""
+    lower = text.lower()
+    if 'ml' not in lower and 'cl' not in lower: return text # Most specs are already oz/dashes
+    return _ML_CL_RE.sub(_convert_match, text)
+
+def convert_many(specs):
+    """Converts a whole list of spec lines with ONE regex pass instead of one call per line."""
+    if not specs: return []
+    # NUL can't appear in a spec and isn't \s, so a match never spans two lines
+    return convert_ml_to_oz("\0".join(specs)).split("\0")
 
 # --- 2. DATABASE SETUP ---
+@_locked
 def init_db():
     """Creates the tables if they don't exist."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
 
     # Table for the Cocktail itself
@@ -58,56 +111,71 @@ def init_db():
             FOREIGN KEY(recipe_id) REFERENCES recipes(id)
         )
     ''')
+
+    # Deletes/updates look ingredients up by recipe_id; without this each one is a full table scan
+    c.execute("CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_recipe_id ON recipe_ingredients(recipe_id)")
     
     conn.commit()
-    conn.close()
 
 # --- 3. HELPER: PARSE STRINGS ---
 def parse_spec_line(spec_line):
     """
     Breaks a string like '1.5 oz Bourbon' into parts: (1.5, 'oz', 'Bourbon')
     """
-    match = re.match(r"([\d\.]+)\s*(oz|dash|dashes|cl|ml)?\s+(.*)", spec_line, re.IGNORECASE)
+    match = _SPEC_RE.match(spec_line)
     if match:
-        amount = float(match.group(1))
-        unit = match.group(2) if match.group(2) else ""
-        ingredient = match.group(3)
-        return amount, unit, ingredient
+        amount, unit, ingredient = match.groups() # One call instead of a group() per field
+        return float(amount), unit or "", ingredient
     return 0, "", spec_line 
 
 # --- 4. APP FUNCTIONS (Used by bar.py) ---
+# Fields get_all_recipes returns for each recipe (id must stay first)
+RECIPE_COLUMNS = ('id', 'name', 'instructions', 'glassware', 'is_favorite',
+                  'category', 'description', 'image_url', 'price', 'spirit')
 
+# Shared SQL text, so every call site reuses the same entry in sqlite3's statement cache
+_SQL_SELECT_RECIPES = f"SELECT {', '.join(RECIPE_COLUMNS)} FROM recipes ORDER BY id"
+_SQL_INSERT_RECIPE = """
+    INSERT INTO recipes (name, instructions, category, description, price, image_url, spirit)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_INGREDIENT = """
+    INSERT INTO recipe_ingredients (recipe_id, amount, unit, ingredient, raw_text)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+@_locked
 def get_all_recipes():
     """Fetches all recipes from DB and formats them for the UI."""
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row 
+    conn = get_db_connection()
     c = conn.cursor()
     
     recipes = []
     try:
-        c.execute("SELECT id, name, instructions, glassware, is_favorite, category, description, image_url, price, spirit FROM recipes")
-        rows = c.fetchall()
-        
-        for row in rows:
-            r_dict = dict(row)
-            
-            # Fetch ingredients for this specific recipe
-            c.execute("SELECT raw_text FROM recipe_ingredients WHERE recipe_id = ?", (row['id'],))
-            ing_rows = c.fetchall()
-            
-            # Flatten ingredients back to list
-            r_dict['specs'] = [i['raw_text'] for i in ing_rows]
+        # Plain tuples zipped with a fixed column list (no sqlite3.Row wrapper per row)
+        c.execute(_SQL_SELECT_RECIPES)
+        by_id = {}
+        for row in c.fetchall():
+            r_dict = dict(zip(RECIPE_COLUMNS, row))
+            r_dict['specs'] = []
+            by_id[row[0]] = r_dict
             recipes.append(r_dict)
+        
+        # All ingredients in ONE query (instead of one per recipe), flattened back onto their recipe
+        c.execute("SELECT recipe_id, raw_text FROM recipe_ingredients ORDER BY id")
+        for recipe_id, raw_text in c:
+            r_dict = by_id.get(recipe_id)
+            if r_dict is not None: r_dict['specs'].append(raw_text)
     except Exception as e:
         print(f"Error loading recipes: {e}")
-    finally:
-        conn.close()
+        raise # Let the caller retry; an empty list here would get cached as "the menu"
         
     return recipes
 
+@_locked
 def save_new_recipe(recipe_data):
     """Saves a single recipe dict to the DB."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
     
     try:
@@ -117,10 +185,7 @@ def save_new_recipe(recipe_data):
             return False # Duplicate
 
         # 1. Insert Recipe
-        c.execute("""
-            INSERT INTO recipes (name, instructions, category, description, price, image_url, spirit) 
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        c.execute(_SQL_INSERT_RECIPE, (
             recipe_data.get('name'), 
             recipe_data.get('instructions', ''), 
             recipe_data.get('category', 'Classics'),
@@ -131,49 +196,92 @@ def save_new_recipe(recipe_data):
         ))
         recipe_id = c.lastrowid
         
-        # 2. Insert Ingredients
-        for spec in recipe_data.get('specs', []):
-            amt, unit, ing = parse_spec_line(spec)
-            
-            c.execute('''
-                INSERT INTO recipe_ingredients (recipe_id, amount, unit, ingredient, raw_text)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (recipe_id, amt, unit, ing, spec))
+        # 2. Insert Ingredients (one executemany instead of a statement per line)
+        rows = [(recipe_id, *parse_spec_line(spec), spec) for spec in recipe_data.get('specs', [])]
+        c.executemany(_SQL_INSERT_INGREDIENT, rows)
             
         conn.commit()
         return True
     except Exception as e:
+        conn.rollback() # Shared connection: never leave a half-done transaction open
         print(f"Error saving recipe: {e}")
         return False
-    finally:
-        conn.close()
+
+@_locked
+def save_new_recipes_bulk(recipes):
+    """Saves a list of recipe dicts in ONE transaction. Returns how many were added.
+    Each recipe gets its own savepoint, so a bad one is skipped without losing the rest."""
+    conn = get_db_connection()
+    c = conn.cursor()
+    
+    try:
+        c.execute("BEGIN") # Outer transaction, so the per-recipe savepoints nest instead of committing
+        count = 0
+        for recipe_data in recipes:
+            # Skip duplicates (same rule as save_new_recipe)
+            c.execute("SELECT id FROM recipes WHERE name = ?", (recipe_data.get('name'),))
+            if c.fetchone():
+                continue
+
+            c.execute("SAVEPOINT bulk_item")
+            try:
+                c.execute(_SQL_INSERT_RECIPE, (
+                    recipe_data.get('name'), 
+                    recipe_data.get('instructions', ''), 
+                    recipe_data.get('category', 'Classics'),
+                    recipe_data.get('description', ''),
+                    recipe_data.get('price', ''),
+                    recipe_data.get('image_url', ''),
+                    recipe_data.get('spirit', '')
+                ))
+                recipe_id = c.lastrowid
+                
+                rows = [(recipe_id, *parse_spec_line(spec), spec) for spec in recipe_data.get('specs', [])]
+                c.executemany(_SQL_INSERT_INGREDIENT, rows)
+            except Exception as e:
+                # Undo just this recipe; everything saved before it stays in the batch
+                c.execute("ROLLBACK TO bulk_item")
+                c.execute("RELEASE bulk_item")
+                print(f"Error saving recipe {recipe_data.get('name')!r}: {e}")
+                continue
+            c.execute("RELEASE bulk_item")
+            count += 1
+            
+        conn.commit() # Single commit for the whole batch
+        return count
+    except Exception as e:
+        conn.rollback()
+        print(f"Error bulk saving recipes: {e}")
+        return 0
 
 # --- NEW FUNCTION IN db_utils.py ---
+def _recipe_columns(c):
+    """Column names currently on the recipes table (one PRAGMA instead of trial ALTERs)."""
+    return {row[1] for row in c.execute("PRAGMA table_info(recipes)")}
+
+@_locked
 def add_category_column():
     """Adds the category column if it doesn't exist."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
+    if 'category' in _recipe_columns(c):
+        print("Category column already exists.")
+        return
     try:
-        # We try to add the column; if it already exists, the database ignores the error.
         c.execute("ALTER TABLE recipes ADD COLUMN category TEXT DEFAULT 'Uncategorized'")
         conn.commit()
         print("Category column ensured in recipes table.")
     except sqlite3.OperationalError as e:
-        # Likely means the column already exists (which is fine)
-        if "duplicate column name" in str(e):
-             print("Category column already exists.")
-        else:
-             print(f"Error adding category column: {e}")
-    finally:
-        conn.close()
+        print(f"Error adding category column: {e}")
 
 # Update the execution block at the very bottom of db_utils.py
 
 # --- 5. NEW: ADMIN FUNCTIONS ---
 
+@_locked
 def delete_recipe(recipe_id):
     """Deletes a recipe and its ingredients."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
     try:
         c.execute("DELETE FROM recipe_ingredients WHERE recipe_id = ?", (recipe_id,))
@@ -181,28 +289,28 @@ def delete_recipe(recipe_id):
         conn.commit()
         return True
     except Exception as e:
+        conn.rollback()
         print(f"Error deleting recipe: {e}")
         return False
-    finally:
-        conn.close()
 
+@_locked
 def update_recipe_category(recipe_id, new_category):
     """Updates the category for a specific recipe."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
     try:
         c.execute("UPDATE recipes SET category = ? WHERE id = ?", (new_category, recipe_id))
         conn.commit()
         return True
     except Exception as e:
+        conn.rollback()
         print(f"Error updating category: {e}")
         return False
-    finally:
-        conn.close()
 
+@_locked
 def update_whole_recipe(recipe_id, data):
     """Updates ALL fields of a recipe, including ingredients."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
     try:
         # 1. Update Core Fields
@@ -217,22 +325,40 @@ def update_whole_recipe(recipe_id, data):
         # This is easier than trying to diff them
         c.execute("DELETE FROM recipe_ingredients WHERE recipe_id=?", (recipe_id,))
         
-        for spec in data.get('specs', []):
-            if not spec.strip(): continue # Skip empty lines
-            amt, unit, ing = parse_spec_line(spec)
-            c.execute("""
-                INSERT INTO recipe_ingredients (recipe_id, amount, unit, ingredient, raw_text)
-                VALUES (?, ?, ?, ?, ?)
-            """, (recipe_id, amt, unit, ing, spec))
+        rows = [(recipe_id, *parse_spec_line(spec), spec) for spec in data.get('specs', []) if spec.strip()] # Skip empty lines
+        c.executemany(_SQL_INSERT_INGREDIENT, rows)
             
         conn.commit()
         return True
     except Exception as e:
+        conn.rollback()
         print(f"Error updating whole recipe: {e}")
         return False
-    finally:
-        conn.close()
 
+# Auto-categorization tables for the migration
+# Spirits that decide the category outright (only a COTW flag or beer_type beats them)
+SPIRIT_CATEGORIES = {
+    'Beer': 'Beer',
+    'Red Wine': 'Wine',
+    'White Wine': 'Wine',
+    'Non-Alcoholic': 'Zero Proof',
+}
+# Raw spirit entries only land in Liquors if they aren't flagged craft/classic
+LIQUOR_SPIRITS = frozenset({'Tequila', 'Vodka', 'Gin', 'Rum', 'Whiskey', 'Bourbon'})
+
+def categorize_item(item):
+    """Picks a menu category for a menu.json item (flags first, then spirit lookups)."""
+    if item.get('is_cotw'): return 'Featured Sips'
+    if item.get('beer_type', ''): return 'Beer'
+    spirit = item.get('spirit', '')
+    category = SPIRIT_CATEGORIES.get(spirit)
+    if category: return category
+    if 'Wine' in spirit: return 'Wine' # e.g. 'Sparkling Wine', 'Rose Wine'
+    if item.get('is_craft'): return 'Craft Cocktails'
+    if item.get('is_classic'): return 'Classics'
+    return 'Liquors' if spirit in LIQUOR_SPIRITS else 'Classics' # Default
+
+@_locked
 def migrate_json_to_db():
     """Reads menu.json and migrates to DB if not present."""
     import json
@@ -242,71 +368,50 @@ def migrate_json_to_db():
         return
 
     print("Starting migration...")
+    conn = get_db_connection()
     try:
         with open("menu.json", "r") as f:
             data = json.load(f)
             
-        conn = sqlite3.connect(DB_NAME)
         c = conn.cursor()
         
+        # Names already in the DB, fetched once instead of one SELECT per item
+        existing = {row[0] for row in c.execute("SELECT name FROM recipes")}
+        
         count = 0
         for item in data:
             # Check if exists
-            c.execute("SELECT id FROM recipes WHERE name = ?", (item.get('name'),))
-            if c.fetchone():
+            if item.get('name') in existing:
                 continue
+            existing.add(item.get('name')) # Later duplicates inside menu.json are skipped too
                 
             # Auto-Categorization Logic
-            category = 'Classics' # Default
-            spirit = item.get('spirit', '')
-            beer_type = item.get('beer_type', '')
-            
-            if item.get('is_cotw'):
-                category = 'Featured Sips'
-            elif spirit == 'Beer' or beer_type:
-                category = 'Beer'
-            elif spirit in ['Red Wine', 'White Wine'] or 'Wine' in spirit:
-                category = 'Wine'
-            elif spirit == 'Non-Alcoholic':
-                category = 'Zero Proof'
-            elif item.get('is_craft'):
-                category = 'Craft Cocktails'
-            elif item.get('is_classic'):
-                category = 'Classics'
-            elif spirit in ['Tequila', 'Vodka', 'Gin', 'Rum', 'Whiskey', 'Bourbon']:
-                category = 'Liquors' # Assuming this maps to Liquors, or we can put cocktails here? 
-                # Actually user list had 'Liquors' separate. Let's aim for 'Craft Cocktails' or 'Classics' mostly for cocktails.
-                # If it's just a raw spirit entry (no ingredients?), maybe Liquors?
-                # For now let's stick to the list: 'Featured Sips', 'Craft Cocktails', 'Classics', 'Beer', 'Wine', 'Liquors', 'Zero Proof'
-                pass
+            category = categorize_item(item)
             
             # Insert Recipe
             c.execute("INSERT INTO recipes (name, instructions, category) VALUES (?, ?, ?)", 
                       (item.get('name'), item.get('instructions', ''), category))
             recipe_id = c.lastrowid
             
-            # Insert Specs (Use spec_recipe from JSON)
+            # Insert Specs (Use spec_recipe from JSON), skipping anything that isn't a plain string
             specs = item.get('spec_recipe', [])
-            for spec in specs:
-                 # Clean up the spec string if needed
-                 if isinstance(spec, str):
-                     amt, unit, ing = parse_spec_line(spec)
-                     c.execute("INSERT INTO recipe_ingredients (recipe_id, amount, unit, ingredient, raw_text) VALUES (?, ?, ?, ?, ?)",
-                               (recipe_id, amt, unit, ing, spec))
+            rows = [(recipe_id, *parse_spec_line(spec), spec) for spec in specs if isinstance(spec, str)]
+            c.executemany(_SQL_INSERT_INGREDIENT, rows)
 
             count += 1
             
         conn.commit()
-        conn.close()
         print(f"Migration complete. Imported {count} new recipes.")
         
     except Exception as e:
+        conn.rollback()
         print(f"Migration failed: {e}")
 
 # --- 6. NEW: DETAILS COLUMNS ---
+@_locked
 def add_details_columns():
     """Adds description, image_url, price, and spirit columns if they don't exist."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
     columns = [
         ("description", "TEXT"),
@@ -315,21 +420,20 @@ def add_details_columns():
         ("spirit", "TEXT") # New Spirit Column for filtering
     ]
     try:
+        existing = _recipe_columns(c)
         for col_name, col_type in columns:
-            try:
-                c.execute(f"ALTER TABLE recipes ADD COLUMN {col_name} {col_type}")
-                print(f"Added column: {col_name}")
-            except sqlite3.OperationalError:
-                pass # Already exists
+            if col_name in existing: continue # Only ALTER what's actually missing
+            c.execute(f"ALTER TABLE recipes ADD COLUMN {col_name} {col_type}")
+            print(f"Added column: {col_name}")
         conn.commit()
     except Exception as e:
+        conn.rollback()
         print(f"Error adding detail columns: {e}")
-    finally:
-        conn.close()
 
+@_locked
 def update_recipe_details(recipe_id, description, price, image_url):
     """Updates the details for a specific recipe."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_db_connection()
     c = conn.cursor()
     try:
         c.execute("""
@@ -340,159 +444,51 @@ def update_recipe_details(recipe_id, description, price, image_url):
         conn.commit()
         return True
     except Exception as e:
+        conn.rollback()
         print(f"Error updating details: {e}")
         return False
-    finally:
-        conn.close()
 
+def _price_str(price_val):
+    """menu.json price (number or preformatted string) -> display string."""
+    if isinstance(price_val, (int, float)) and price_val > 0:
+        return f"${price_val:.0f}"
+    if isinstance(price_val, str):
+        return price_val
+    return ""
+
+@_locked
 def backfill_details_from_json():
     """Updates existing DB records with data from menu.json."""
     import json
     if not os.path.exists("menu.json"): return
 
     print("Backfilling details from JSON...")
+    conn = get_db_connection()
     try:
         with open("menu.json", "r") as f:
             data = json.load(f)
             
-        conn = sqlite3.connect(DB_NAME)
         c = conn.cursor()
         
-        count = 0
-        for item in data:
-            # Map JSON fields
-            desc = item.get('description', '')
-            img = item.get('image_path', '')
-            spirit = item.get('spirit', '')
-            
-            # Handle Price
-            price_val = item.get('price', 0.0)
-            price_str = ""
-            try:
-                if isinstance(price_val, (int, float)) and price_val > 0:
-                    price_str = f"${price_val:.0f}"
-                elif isinstance(price_val, str):
-                     price_str = price_val
-            except Exception:
-                price_str = ""
-            
-            # Update matching recipe
-            c.execute("""
-                UPDATE recipes 
-                SET description = ?, image_url = ?, price = ?, spirit = ?
-                WHERE name = ?
-            """, (desc, img, price_str, spirit, item.get('name')))
-            
-            if c.rowcount > 0:
-                count += 1
-                
-        conn.commit()
-        conn.close()
-        print(f"Backfill complete. Updated {count} recipes.")
-        
-    except Exception as e:
-        print(f"Backfill failed: {e}")
-
-# --- Admin Tools (Copy and Paste to bottom of db_utils.py) ---
-
-def delete_recipe(recipe_id):
-    conn = get_db_connection()
-    c = conn.cursor()
-    try:
-        # Delete ingredients first (foreign key hygiene)
-        c.execute("DELETE FROM recipe_ingredients WHERE recipe_id = ?", (recipe_id,))
-        # Delete the recipe
-        c.execute("DELETE FROM recipes WHERE id = ?", (recipe_id,))
-        conn.commit()
-        return True
-    except Exception as e:
-        print(f"Error deleting recipe: {e}")
-        return False
-    finally:
-        conn.close()
-
-def update_recipe_category(recipe_id, new_category):
-    conn = get_db_connection()
-    c = conn.cursor()
-    try:
-        c.execute("UPDATE recipes SET category = ? WHERE id = ?", (new_category, recipe_id))
-        conn.commit()
-    finally:
-        conn.close()
-
-def update_recipe_details(recipe_id, description, image_url, price, spirit):
-    conn = get_db_connection()
-    c = conn.cursor()
-    try:
-        c.execute("""
+        # One UPDATE statement for the whole catalog
+        rows = [
+            (item.get('description', ''), item.get('image_path', ''), _price_str(item.get('price', 0.0)),
+             item.get('spirit', ''), item.get('name'))
+            for item in data
+        ]
+        c.executemany("""
             UPDATE recipes 
             SET description = ?, image_url = ?, price = ?, spirit = ?
-            WHERE id = ?
-        """, (description, image_url, price, spirit, recipe_id))
-        conn.commit()
-    finally:
-        conn.close()
-
-def update_whole_recipe(recipe_id, name, category, description, price, image_url, spirit, ingredients_text):
-    """
-    Updates the recipe metadata AND replaces ingredients.
-    ingredients_text should be a string (from text area).
-    """
-    conn = get_db_connection()
-    c = conn.cursor()
-    try:
-        # 1. Update main recipe fields
-        c.execute("""
-            UPDATE recipes 
-            SET name = ?, category = ?, description = ?, price = ?, image_url = ?, spirit = ?
-            WHERE id = ?
-        """, (name, category, description, price, image_url, spirit, recipe_id))
+            WHERE name = ?
+        """, rows)
+        count = c.rowcount # executemany sums the matched rows
 
-        # 2. Update ingredients (simplest way: delete all old, add all new)
-        # Only do this if ingredients_text is provided
-        if ingredients_text:
-            c.execute("DELETE FROM recipe_ingredients WHERE recipe_id = ?", (recipe_id,))
-            
-            # Split text by newlines to get list of ingredients
-            lines = [line.strip() for line in ingredients_text.split('\n') if line.strip()]
-            for line in lines:
-                c.execute("INSERT INTO recipe_ingredients (recipe_id, ingredient) VALUES (?, ?)", 
-                          (recipe_id, line))
-        
         conn.commit()
-        return True
-    except Exception as e:
-        print(f"Error updating recipe: {e}")
-        return False
-    finally:
-        conn.close()
-
-def create_new_recipe(name, category, description, price, image_url, spirit, ingredients_text):
-    conn = get_db_connection()
-    c = conn.cursor()
-    try:
-        # 1. Insert into recipes
-        c.execute("""
-            INSERT INTO recipes (name, category, description, price, image_url, spirit)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (name, category, description, price, image_url, spirit))
-        
-        new_id = c.lastrowid
-        
-        # 2. Insert ingredients
-        if ingredients_text:
-            lines = [line.strip() for line in ingredients_text.split('\n') if line.strip()]
-            for line in lines:
-                c.execute("INSERT INTO recipe_ingredients (recipe_id, ingredient) VALUES (?, ?)", 
-                          (new_id, line))
+        print(f"Backfill complete. Updated {count} recipes.")
         
-        conn.commit()
-        return True
     except Exception as e:
-        print(f"Error creating recipe: {e}")
-        return False
-    finally:
-        conn.close()
+        conn.rollback()
+        print(f"Backfill failed: {e}")
 
 # Run init if this file is run directly
 if __name__ == "__main__":